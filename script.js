@@ -3,6 +3,9 @@ const API_HEADERS = {
   "Content-Type": "application/json",
   Authorization: "Bearer sk-fake-key",
 };
+const CARRIAGE_RETURN_PATTERN = /\r/g;
+const EVENT_SEPARATOR_PATTERN = /\n\n/;
+const DATA_PREFIX = "data:";
 
 const terminal = document.getElementById("terminal");
 const form = document.getElementById("prompt-form");
@@ -24,8 +27,9 @@ function createLine(role, initialText = "", withCursor = false) {
   textEl.textContent = initialText;
   contentEl.appendChild(textEl);
 
+  let cursorEl = null;
   if (withCursor) {
-    const cursorEl = document.createElement("span");
+    cursorEl = document.createElement("span");
     cursorEl.className = "cursor";
     contentEl.appendChild(cursorEl);
   }
@@ -35,12 +39,25 @@ function createLine(role, initialText = "", withCursor = false) {
   terminal.appendChild(line);
   terminal.scrollTop = terminal.scrollHeight;
 
-  return { line, roleEl, contentEl, textEl, cursorEl: contentEl.querySelector(".cursor") };
+  return { line, roleEl, contentEl, textEl, cursorEl };
 }
 
 async function streamCompletion(prompt) {
   const { textEl } = createLine("assistant", "", true);
-  let accumulated = "";
+  const textNode = textEl.appendChild(document.createTextNode(""));
+  let pending = "";
+  let renderFrame = 0;
+
+  const render = () => {
+    renderFrame = 0;
+    textNode.appendData(pending);
+    pending = "";
+    terminal.scrollTop = terminal.scrollHeight;
+  };
+
+  const scheduleRender = () => {
+    if (!renderFrame) renderFrame = requestAnimationFrame(render);
+  };
 
   try {
     const response = await fetch(API_URL, {
@@ -66,20 +83,18 @@ async function streamCompletion(prompt) {
     while (true) {
       const { value, done } = await reader.read();
       if (done) break;
-      buffer += decoder.decode(value, { stream: true });
-      buffer = buffer.replace(/\r/g, "");
+      buffer += decoder
+        .decode(value, { stream: true })
+        .replace(CARRIAGE_RETURN_PATTERN, "");
 
-      const events = buffer.split(/\n\n/);
+      const events = buffer.split(EVENT_SEPARATOR_PATTERN);
       buffer = events.pop() ?? "";
 
       for (const event of events) {
-        const lines = event
-          .split("\n")
-          .map((line) => line.trim())
-          .filter(Boolean);
-        for (const line of lines) {
-          if (!line.startsWith("data:")) continue;
-          const payload = line.replace(/^data:\s*/, "");
+        for (const rawLine of event.split("\n")) {
+          const line = rawLine.trim();
+          if (!line.startsWith(DATA_PREFIX)) continue;
+          const payload = line.slice(DATA_PREFIX.length).trimStart();
           if (payload === "[DONE]") {
             buffer = "";
             return;
@@ -88,9 +103,8 @@ async function streamCompletion(prompt) {
             const data = JSON.parse(payload);
             const delta = data.choices?.[0]?.delta?.content || "";
             if (delta) {
-              accumulated += delta;
-              textEl.textContent = accumulated;
-              terminal.scrollTop = terminal.scrollHeight;
+              pending += delta;
+              scheduleRender();
             }
           } catch (err) {
             console.error("Failed to parse payload", err, payload);
@@ -99,6 +113,7 @@ async function streamCompletion(prompt) {
       }
     }
   } catch (error) {
+    cancelAnimationFrame(renderFrame);
     textEl.textContent = `Error: ${error.message}`;
     console.error(error);
   }